@@ -70,6 +70,8 @@ def import_database(
 
     if ssh_tunnel:
         ssh_tunnel["database_id"] = database.id
-        SSHTunnel.import_from_dict(ssh_tunnel, recursive=False)
+        # attach through the relationship, so that a tunnel already loaded from the
+        # database isn't left stale
+        database.ssh_tunnels = SSHTunnel.import_from_dict(ssh_tunnel, recursive=False)
 
     return database
@@ -42,8 +42,6 @@ from superset.views.database.validators import schema_allows_file_upload
 
 logger = logging.getLogger(__name__)
 
-READ_CHUNK_SIZE = 1000
-
 
 class ReaderOptions(TypedDict, total=False):
     already_exists: str
@@ -103,7 +101,6 @@ class BaseDataReader:
         try:
             data_table = Table(table=table_name, schema=schema_name)
             to_sql_kwargs = {
-                "chunksize": READ_CHUNK_SIZE,
                 "if_exists": self._options.get("already_exists", "fail"),
                 "index": self._options.get("dataframe_index", False),
             }
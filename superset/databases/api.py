@@ -341,7 +341,7 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
             "result": database_connection_schema.dump(database, many=False),
         }
         try:
-            if ssh_tunnel := DatabaseDAO.get_ssh_tunnel(pk):
+            if database and (ssh_tunnel := database.ssh_tunnels):
                 response["result"]["ssh_tunnel"] = ssh_tunnel.data
             return self.response(200, **response)
         except SupersetException as ex:
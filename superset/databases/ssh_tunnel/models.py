@@ -15,13 +15,17 @@
 # specific language governing permissions and limitations
 # under the License.
 
+from functools import lru_cache
 from typing import Any
 
 import sqlalchemy as sa
 from flask import current_app
 from flask_appbuilder import Model
-from sqlalchemy.orm import backref, relationship
-from sqlalchemy.types import Text
+from sqlalchemy import event
+from sqlalchemy.engine import Dialect
+from sqlalchemy.orm import relationship
+from sqlalchemy.types import Text, TypeDecorator
+from sqlalchemy_utils import EncryptedType
 
 from superset.constants import PASSWORD_MASK
 from superset.extensions import encrypted_field_factory
@@ -31,65 +35,142 @@ from superset.models.helpers import (
     ExtraJSONMixin,
     ImportExportMixin,
 )
+from superset.utils.encrypt import ENC_ADAPTER_TAG_ATTR_NAME
 
 app_config = current_app.config
 
 
+class MemoizedEncryptedType(  # pylint: disable=abstract-method, too-many-ancestors
+    EncryptedType
+):
+    """
+    An ``EncryptedType`` that caches decrypted values.
+
+    Decrypting sets up the cipher with the key and decrypts the payload on every
+    load, so the plaintext is cached by key and ciphertext. A value is decrypted once per process,
+    and rotating ``SECRET_KEY`` never serves values decrypted with a previous key.
+
+    Keeping the plaintext in memory doesn't expose the credentials any further: the
+    key that decrypts them lives in the same process, and loaded tunnels already hold
+    them in plain text. The cache is bounded and is cleared whenever a tunnel is
+    updated or deleted.
+    """
+
+    cache_ok = True
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.cache = lru_cache(maxsize=1024)(self._decrypt)
+
+    def _decrypt(  # pylint: disable=unused-argument
+        self, key: Any, value: Any, dialect: Dialect
+    ) -> Any:
+        # the key is only part of the cache key
+        return super().process_result_value(value, dialect)
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> Any:
+        if value is None:
+            return None
+        key = self._key() if callable(self._key) else self._key
+        try:
+            return self.cache(key, value, dialect)
+        except TypeError:
+            # unhashable payloads (eg, ``memoryview``) are decrypted directly
+            return super().process_result_value(value, dialect)
+
+
+def create_encrypted_text() -> TypeDecorator:
+    """
+    Create the type of the credential columns.
+
+    The decryption cache is only added to the default ``EncryptedType``; types from
+    custom encrypted field adapters are used as is.
+    """
+    encrypted_type = encrypted_field_factory.create(Text)
+    if type(encrypted_type) is not EncryptedType:  # pylint: disable=unidiomatic-typecheck
+        return encrypted_type
+
+    memoized_type = MemoizedEncryptedType(Text, encrypted_type.key)
+    setattr(memoized_type, ENC_ADAPTER_TAG_ATTR_NAME, True)
+    return memoized_type
+
+
+# a single type instance is shared by all the credential columns, so that they also
+# share the decryption cache
+_ENCRYPTED_TEXT = create_encrypted_text()
+
+
 class SSHTunnel(AuditMixinNullable, ExtraJSONMixin, ImportExportMixin, Model):
     """
     A ssh tunnel configuration in a database.
     """
 
     __tablename__ = "ssh_tunnels"
+    __table_args__ = (
+        # in Postgres the address and port are stored in the index, so the tunnels
+        # of a database can be listed without reading the credentials
+        sa.Index(
+            "ix_ssh_tunnels_database_id_covering",
+            "database_id",
+            unique=True,
+            postgresql_include=["server_address", "server_port"],
+        ),
+    )
 
     id = sa.Column(sa.Integer, primary_key=True)
-    database_id = sa.Column(
-        sa.Integer, sa.ForeignKey("dbs.id"), nullable=False, unique=True
-    )
+    database_id = sa.Column(sa.Integer, sa.ForeignKey("dbs.id"), nullable=False)
     database: Database = relationship(
         "Database",
-        backref=backref("ssh_tunnels", uselist=False, cascade="all, delete-orphan"),
+        back_populates="ssh_tunnels",
         foreign_keys=[database_id],
     )
 
-    server_address = sa.Column(sa.Text)
+    server_address = sa.Column(sa.String(256))
     server_port = sa.Column(sa.Integer)
-    username = sa.Column(encrypted_field_factory.create(Text))
+    username = sa.Column(_ENCRYPTED_TEXT)
 
     # basic authentication
-    password = sa.Column(encrypted_field_factory.create(Text), nullable=True)
+    password = sa.Column(_ENCRYPTED_TEXT, nullable=True)
 
     # password protected pkey authentication
-    private_key = sa.Column(encrypted_field_factory.create(Text), nullable=True)
-    private_key_password = sa.Column(
-        encrypted_field_factory.create(Text), nullable=True
-    )
+    private_key = sa.Column(_ENCRYPTED_TEXT, nullable=True)
+    private_key_password = sa.Column(_ENCRYPTED_TEXT, nullable=True)
 
-    export_fields = [
+    export_fields = (
         "server_address",
         "server_port",
         "username",
         "password",
         "private_key",
         "private_key_password",
-    ]
+    )
 
-    extra_import_fields = [
-        "database_id",
-    ]
+    extra_import_fields = ("database_id",)
+
+    # fields returned to the client as is, and credentials that are only masked
+    _data_fields = ("id", "server_address", "server_port", "username")
+    _secret_fields = ("password", "private_key", "private_key_password")
 
     @property
     def data(self) -> dict[str, Any]:
+        # read loaded values straight from the instance state, bypassing the
+        # instrumented attributes; expired or unloaded ones still go through them
+        state = self.__dict__
         output = {
-            "id": self.id,
-            "server_address": self.server_address,
-            "server_port": self.server_port,
-            "username": self.username,
+            key: state[key] if key in state else getattr(self, key)
+            for key in self._data_fields
         }
-        if self.password is not None:
-            output["password"] = PASSWORD_MASK
-        if self.private_key is not None:
-            output["private_key"] = PASSWORD_MASK
-        if self.private_key_password is not None:
-            output["private_key_password"] = PASSWORD_MASK
+        for key in self._secret_fields:
+            value = state[key] if key in state else getattr(self, key)
+            if value is not None:
+                output[key] = PASSWORD_MASK
         return output
+
+
+@event.listens_for(SSHTunnel, "after_update")
+@event.listens_for(SSHTunnel, "after_delete")
+def clear_decryption_cache(  # pylint: disable=unused-argument
+    mapper: Any, connection: Any, target: SSHTunnel
+) -> None:
+    if isinstance(_ENCRYPTED_TEXT, MemoizedEncryptedType):
+        _ENCRYPTED_TEXT.cache.cache_clear()
@@ -18,11 +18,16 @@
 
 from __future__ import annotations
 
+import contextlib
 import logging
 import re
 import warnings
+from collections.abc import Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from re import Match, Pattern
+from types import MappingProxyType
 from typing import (
     Any,
     Callable,
@@ -33,7 +38,7 @@ from typing import (
     TypedDict,
     Union,
 )
-from urllib.parse import urlencode, urljoin
+from urllib.parse import urlencode
 from uuid import uuid4
 
 import pandas as pd
@@ -42,11 +47,12 @@ import sqlparse
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin
 from deprecation import deprecated
-from flask import current_app, g, url_for
+from flask import current_app, g, has_request_context, request, url_for
 from flask_appbuilder.security.sqla.models import User
 from flask_babel import gettext as __, lazy_gettext as _
 from marshmallow import fields, Schema
 from marshmallow.validate import Range
+from requests.adapters import HTTPAdapter
 from sqlalchemy import column, select, types
 from sqlalchemy.engine.base import Engine
 from sqlalchemy.engine.interfaces import Compiled, Dialect
@@ -57,9 +63,10 @@ from sqlalchemy.sql import literal_column, quoted_name, text
 from sqlalchemy.sql.expression import ColumnClause, Select, TextAsFrom, TextClause
 from sqlalchemy.types import TypeEngine
 from sqlparse.tokens import CTE
+from urllib3.util.retry import Retry
 
 from superset import sql_parse
-from superset.constants import TimeGrain as TimeGrainConstants
+from superset.constants import LRU_CACHE_MAX_SIZE, TimeGrain as TimeGrainConstants
 from superset.databases.utils import get_table_metadata, make_url_safe
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import DisallowedSQLFunction, OAuth2Error, OAuth2RedirectError
@@ -73,7 +80,7 @@ from superset.superset_typing import (
 )
 from superset.utils import core as utils, json
 from superset.utils.core import ColumnSpec, GenericDataType
-from superset.utils.hashing import md5_sha_from_str
+from superset.utils.hashing import blake2b_from_str
 from superset.utils.network import is_hostname_valid, is_port_open
 from superset.utils.oauth2 import encode_oauth2_state
 
@@ -92,6 +99,27 @@ ColumnTypeMapping = tuple[
 
 logger = logging.getLogger()
 
+# numbered or named backreferences in a regular expression
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
+# an ISO 8601 duration, optionally starting or ending at a given time
+_TIME_GRAIN_SORT_RE = re.compile(r"(.*\/)?(P|PT)([0-9\.]+)(S|M|H|D|W|M|Y)(\/.*)?")
+
+# positions used when sorting time grains
+_TIME_GRAIN_SORT_POS = {"FIRST": 0, "SECOND": 1, "THIRD": 2, "LAST": 3}
+_SECOND_MINUTE_HOUR_POS = {"S": 0, "M": 1, "H": 2}
+_DAY_WEEK_MONTH_YEAR_POS = {"D": 0, "W": 1, "M": 2, "Y": 3}
+
+_EMPTY_FROZENSET: frozenset[str] = frozenset()
+
+# regex flags that can be scoped to a single alternative of a combined pattern
+_SCOPED_REGEX_FLAGS = (
+    (re.IGNORECASE, "i"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+    (re.VERBOSE, "x"),
+)
+
 
 def convert_inspector_columns(cols: list[SQLAColumnType]) -> list[ResultSetColumnType]:
     result_set_columns: list[ResultSetColumnType] = []
@@ -100,6 +128,62 @@ def convert_inspector_columns(cols: list[SQLAColumnType]) -> list[ResultSetColum
     return result_set_columns
 
 
+def _create_oauth2_session() -> requests.Session:
+    """
+    Create a session with a connection pool for the OAuth2 token requests.
+    """
+    http_session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=64,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    )
+    http_session.mount("http://", adapter)
+    http_session.mount("https://", adapter)
+    return http_session
+
+
+# shared so that connections to the token endpoints are reused across requests,
+# instead of doing a new TCP/TLS handshake every time a token is refreshed
+_OAUTH2_SESSION = _create_oauth2_session()
+
+
+@lru_cache(maxsize=8)
+def _build_oauth2_redirect_uri(  # pylint: disable=unused-argument
+    host_url: str | None,
+    server_name: str | None,
+    application_root: str | None,
+    url_scheme: str | None,
+) -> str:
+    """
+    Build the external URI of the OAuth2 redirect endpoint.
+
+    The arguments are not used directly, they are the inputs that determine the URI
+    returned by ``url_for`` and act as the cache key.
+    """
+    return url_for("DatabaseRestApi.oauth2", _external=True)
+
+
+def _get_oauth2_redirect_uri() -> str:
+    """
+    Return the default OAuth2 redirect URI, building it only once per host.
+    """
+    config = current_app.config
+    return _build_oauth2_redirect_uri(
+        request.host_url if has_request_context() else None,
+        config.get("SERVER_NAME"),
+        config.get("APPLICATION_ROOT"),
+        config.get("PREFERRED_URL_SCHEME"),
+    )
+
+
+def N_(message: str) -> str:  # pylint: disable=invalid-name
+    """
+    Mark a message for extraction without translating it.
+    """
+    return message
+
+
 class TimeGrain(NamedTuple):
     name: str  # TODO: redundant field, remove
     label: str
@@ -107,26 +191,28 @@ class TimeGrain(NamedTuple):
     duration: str | None
 
 
+# time grain names are kept in English, and only translated when building the labels
+# in ``BaseEngineSpec.get_time_grains``
 builtin_time_grains: dict[str | None, str] = {
-    TimeGrainConstants.SECOND: __("Second"),
-    TimeGrainConstants.FIVE_SECONDS: __("5 second"),
-    TimeGrainConstants.THIRTY_SECONDS: __("30 second"),
-    TimeGrainConstants.MINUTE: __("Minute"),
-    TimeGrainConstants.FIVE_MINUTES: __("5 minute"),
-    TimeGrainConstants.TEN_MINUTES: __("10 minute"),
-    TimeGrainConstants.FIFTEEN_MINUTES: __("15 minute"),
-    TimeGrainConstants.THIRTY_MINUTES: __("30 minute"),
-    TimeGrainConstants.HOUR: __("Hour"),
-    TimeGrainConstants.SIX_HOURS: __("6 hour"),
-    TimeGrainConstants.DAY: __("Day"),
-    TimeGrainConstants.WEEK: __("Week"),
-    TimeGrainConstants.MONTH: __("Month"),
-    TimeGrainConstants.QUARTER: __("Quarter"),
-    TimeGrainConstants.YEAR: __("Year"),
-    TimeGrainConstants.WEEK_STARTING_SUNDAY: __("Week starting Sunday"),
-    TimeGrainConstants.WEEK_STARTING_MONDAY: __("Week starting Monday"),
-    TimeGrainConstants.WEEK_ENDING_SATURDAY: __("Week ending Saturday"),
-    TimeGrainConstants.WEEK_ENDING_SUNDAY: __("Week ending Sunday"),
+    TimeGrainConstants.SECOND: N_("Second"),
+    TimeGrainConstants.FIVE_SECONDS: N_("5 second"),
+    TimeGrainConstants.THIRTY_SECONDS: N_("30 second"),
+    TimeGrainConstants.MINUTE: N_("Minute"),
+    TimeGrainConstants.FIVE_MINUTES: N_("5 minute"),
+    TimeGrainConstants.TEN_MINUTES: N_("10 minute"),
+    TimeGrainConstants.FIFTEEN_MINUTES: N_("15 minute"),
+    TimeGrainConstants.THIRTY_MINUTES: N_("30 minute"),
+    TimeGrainConstants.HOUR: N_("Hour"),
+    TimeGrainConstants.SIX_HOURS: N_("6 hour"),
+    TimeGrainConstants.DAY: N_("Day"),
+    TimeGrainConstants.WEEK: N_("Week"),
+    TimeGrainConstants.MONTH: N_("Month"),
+    TimeGrainConstants.QUARTER: N_("Quarter"),
+    TimeGrainConstants.YEAR: N_("Year"),
+    TimeGrainConstants.WEEK_STARTING_SUNDAY: N_("Week starting Sunday"),
+    TimeGrainConstants.WEEK_STARTING_MONDAY: N_("Week starting Monday"),
+    TimeGrainConstants.WEEK_ENDING_SATURDAY: N_("Week ending Saturday"),
+    TimeGrainConstants.WEEK_ENDING_SUNDAY: N_("Week ending Sunday"),
 }
 
 
@@ -150,11 +236,29 @@ class TimestampExpression(ColumnClause):  # pylint: disable=abstract-method, too
         return ColumnClause
 
 
+@lru_cache(maxsize=LRU_CACHE_MAX_SIZE)
+def _split_timegrain_expression(expr: str) -> tuple[str, ...]:
+    """
+    Split a time grain expression around its ``{col}`` placeholders.
+    """
+    return tuple(expr.split("{col}"))
+
+
+@lru_cache(maxsize=LRU_CACHE_MAX_SIZE)
+def _format_sql(sql: str, engine: str) -> str:
+    """
+    Pretty-print a generated query. The output only depends on the arguments, so
+    queries that are generated repeatedly are only parsed once.
+    """
+    return SQLScript(sql, engine=engine).format()
+
+
 @compiles(TimestampExpression)
 def compile_timegrain_expression(
     element: TimestampExpression, compiler: Compiled, **kwargs: Any
 ) -> str:
-    return element.name.replace("{col}", compiler.process(element.col, **kwargs))
+    parts = _split_timegrain_expression(element.name)
+    return compiler.process(element.col, **kwargs).join(parts)
 
 
 class LimitMethod:  # pylint: disable=too-few-public-methods
@@ -203,6 +307,9 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
     engine_aliases: set[str] = set()
     drivers: dict[str, str] = {}
     default_driver: str | None = None
+    # lookup sets used by ``supports_backend``, rebuilt for each subclass
+    _backends: frozenset[str] = frozenset({engine, *engine_aliases})
+    _drivers: frozenset[str] = frozenset(drivers)
 
     # placeholder with the SQLAlchemy URI template
     sqlalchemy_uri_placeholder = (
@@ -332,6 +439,10 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
     )
     # engine-specific type mappings to check prior to the defaults
     column_type_mappings: tuple[ColumnTypeMapping, ...] = ()
+    # all the type mappings in the order they're checked, rebuilt for each subclass
+    _merged_column_type_mappings: tuple[ColumnTypeMapping, ...] = (
+        column_type_mappings + _default_column_type_mappings
+    )
 
     # type-specific functions to mutate values received from the database.
     # Needed on certain databases that return values in an unexpected format
@@ -378,7 +489,7 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
     # to consider for the engines with TOP SQL parsing
     top_keywords: set[str] = {"TOP"}
     # A set of disallowed connection query parameters by driver name
-    disallow_uri_query_params: dict[str, set[str]] = {}
+    disallow_uri_query_params: dict[str, set[str] | frozenset[str]] = {}
     # A Dict of query parameters that will always be used on every connection
     # by driver name
     enforce_uri_query_params: dict[str, dict[str, Any]] = {}
@@ -396,6 +507,11 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
     # if True, database will be listed as option in the upload file form
     supports_file_upload = True
 
+    # Number of rows inserted per statement when uploading a file, so that multi-row
+    # inserts don't grow with the size of the file; lower it for drivers with tight
+    # limits on bind parameters or packet size
+    df_to_sql_chunksize: int | None = 1000
+
     # Is the DB engine spec able to change the default schema? This requires implementing
     # a custom `adjust_engine_params` method.
     supports_dynamic_schema = False
@@ -422,6 +538,27 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
     # Driver-specific exception that should be mapped to OAuth2RedirectError
     oauth2_exception = OAuth2RedirectError
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._backends = frozenset({cls.engine, *cls.engine_aliases})
+        cls._drivers = frozenset(cls.drivers)
+        cls._merged_column_type_mappings = tuple(cls.column_type_mappings) + tuple(
+            cls._default_column_type_mappings
+        )
+        cls.disallow_uri_query_params = {
+            driver: frozenset(params)
+            for driver, params in cls.disallow_uri_query_params.items()
+        }
+
+        # warn once when the class is defined, instead of on every call
+        if "extra_table_metadata" in vars(cls):
+            warnings.warn(
+                "The `extra_table_metadata` method is deprecated, please implement "
+                "the `get_extra_table_metadata` method in the DB engine spec.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+
     @classmethod
     def is_oauth2_enabled(cls) -> bool:
         return (
@@ -442,7 +579,7 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         re-run the query after authorization.
         """
         tab_id = str(uuid4())
-        default_redirect_uri = url_for("DatabaseRestApi.oauth2", _external=True)
+        default_redirect_uri = _get_oauth2_redirect_uri()
 
         # The state is passed to the OAuth2 provider, and sent back to Superset after
         # the user authorizes the access. The redirect endpoint in Superset can then
@@ -479,14 +616,15 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         """
         Build the DB engine spec level OAuth2 client config.
         """
-        oauth2_config = current_app.config["DATABASE_OAUTH2_CLIENTS"]
+        # resolve the app proxy once, since the config is read several times
+        app_config = current_app.config
+        oauth2_config = app_config["DATABASE_OAUTH2_CLIENTS"]
         if cls.engine_name not in oauth2_config:
             return None
 
         db_engine_spec_config = oauth2_config[cls.engine_name]
-        redirect_uri = current_app.config.get(
-            "DATABASE_OAUTH2_REDIRECT_URI",
-            url_for("DatabaseRestApi.oauth2", _external=True),
+        redirect_uri = (
+            app_config.get("DATABASE_OAUTH2_REDIRECT_URI") or _get_oauth2_redirect_uri()
         )
 
         config: OAuth2ClientConfig = {
@@ -526,7 +664,8 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
             "client_id": config["id"],
             "prompt": "consent",
         }
-        return urljoin(uri, "?" + urlencode(params))
+        separator = "&" if "?" in uri else "?"
+        return f"{uri}{separator}{urlencode(params)}"
 
     @classmethod
     def get_oauth2_token(
@@ -539,7 +678,7 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         """
         timeout = current_app.config["DATABASE_OAUTH2_TIMEOUT"].total_seconds()
         uri = config["token_request_uri"]
-        response = requests.post(
+        response = _OAUTH2_SESSION.post(
             uri,
             json={
                 "code": code,
@@ -550,7 +689,7 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
             },
             timeout=timeout,
         )
-        return response.json()
+        return json.loads(response.content)
 
     @classmethod
     def get_oauth2_fresh_token(
@@ -563,7 +702,7 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         """
         timeout = current_app.config["DATABASE_OAUTH2_TIMEOUT"].total_seconds()
         uri = config["token_request_uri"]
-        response = requests.post(
+        response = _OAUTH2_SESSION.post(
             uri,
             json={
                 "client_id": config["id"],
@@ -573,7 +712,7 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
             },
             timeout=timeout,
         )
-        return response.json()
+        return json.loads(response.content)
 
     @classmethod
     def get_allows_alias_in_select(
@@ -630,16 +769,16 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         Returns true if the DB engine spec supports a given SQLAlchemy backend/driver.
         """
         # check the backend first
-        if backend != cls.engine and backend not in cls.engine_aliases:
+        if backend not in cls._backends:
             return False
 
         # originally DB engine specs didn't declare any drivers and the check was made
         # only on the engine; if that's the case, ignore the driver for backwards
         # compatibility
-        if not cls.drivers or driver is None:
+        if not cls._drivers or driver is None:
             return True
 
-        return driver in cls.drivers
+        return driver in cls._drivers
 
     @classmethod
     def get_default_catalog(
@@ -759,9 +898,13 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         return False
 
     @classmethod
+    @lru_cache(maxsize=LRU_CACHE_MAX_SIZE)
     def get_text_clause(cls, clause: str) -> TextClause:
         """
-        SQLAlchemy wrapper to ensure text clauses are escaped properly
+        SQLAlchemy wrapper to ensure text clauses are escaped properly.
+
+        Text clauses are immutable, so the same instance is returned for repeated
+        clauses (eg, RLS predicates and time filters) instead of parsing them again.
 
         :param clause: string clause with potentially unescaped characters
         :return: text clause with escaped characters
@@ -805,7 +948,7 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         """
         if time_grain:
             type_ = str(getattr(col, "type", ""))
-            time_expr = cls.get_time_grain_expressions().get(time_grain)
+            time_expr = cls.get_time_grain_expression(time_grain)
             if not time_expr:
                 raise NotImplementedError(
                     f"No grain spec for {time_grain} for database {cls.engine}"
@@ -822,13 +965,25 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
             time_expr = "{col}"
 
         # if epoch, translate to DATE using db specific conf
-        if pdf == "epoch_s":
-            time_expr = time_expr.replace("{col}", cls.epoch_to_dttm())
-        elif pdf == "epoch_ms":
-            time_expr = time_expr.replace("{col}", cls.epoch_ms_to_dttm())
+        if pdf in {"epoch_s", "epoch_ms"}:
+            time_expr = cls._convert_epoch_time_expr(time_expr, pdf)
 
         return TimestampExpression(time_expr, col, type_=col.type)
 
+    @classmethod
+    @lru_cache(maxsize=LRU_CACHE_MAX_SIZE)
+    def _convert_epoch_time_expr(cls, time_expr: str, pdf: str) -> str:
+        """
+        Convert the column of a time expression from epoch to datetime.
+
+        :param time_expr: time expression referencing the column as `{col}`
+        :param pdf: date format (seconds or milliseconds)
+        :return: The time expression applied to the converted column
+        """
+        if pdf == "epoch_s":
+            return time_expr.replace("{col}", cls.epoch_to_dttm())
+        return time_expr.replace("{col}", cls.epoch_ms_to_dttm())
+
     @classmethod
     def get_time_grains(cls) -> tuple[TimeGrain, ...]:
         """
@@ -836,11 +991,41 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
 
         :return: All time grains supported by the engine
         """
+        config = current_app.config
+        grain_addon_expressions = config["TIME_GRAIN_ADDON_EXPRESSIONS"]
 
+        # the config is part of the cache key, so changes to it are picked up
+        return cls._get_time_grains(
+            tuple(config["TIME_GRAIN_ADDONS"].items()),
+            tuple(grain_addon_expressions.get(cls.engine, {}).items()),
+            tuple(config["TIME_GRAIN_DENYLIST"]),
+        )
+
+    @classmethod
+    @lru_cache(maxsize=LRU_CACHE_MAX_SIZE)
+    def _get_time_grains(
+        cls,
+        grain_addons: tuple[tuple[str, str], ...],
+        grain_addon_expressions: tuple[tuple[str | None, str], ...],
+        denylist: tuple[str, ...],
+    ) -> tuple[TimeGrain, ...]:
+        """
+        Build the supported time grains of the engine. The labels are lazy
+        translations, so they are safe to share across requests.
+
+        :param grain_addons: Additional time grain names
+        :param grain_addon_expressions: Additional expressions for the engine
+        :param denylist: Time grains that should be excluded
+        :return: All time grains supported by the engine
+        """
         ret_list = []
         time_grains = builtin_time_grains.copy()
-        time_grains.update(current_app.config["TIME_GRAIN_ADDONS"])
-        for duration, func in cls.get_time_grain_expressions().items():
+        time_grains.update(grain_addons)
+        time_grain_expressions = cls._sorted_time_grain_exprs(
+            grain_addon_expressions,
+            denylist,
+        )
+        for duration, func in time_grain_expressions.items():
             if duration in time_grains:
                 name = time_grains[duration]
                 ret_list.append(TimeGrain(name, _(name), func, duration))
@@ -848,92 +1033,113 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
 
     @classmethod
     def _sort_time_grains(
-        cls, val: tuple[str | None, str], index: int
-    ) -> float | int | str:
+        cls, val: tuple[str | None, str]
+    ) -> tuple[float | int, float | int, float | int, float | int]:
         """
-        Return an ordered time-based value of a portion of a time grain
-        for sorting
+        Return the sort key of a time grain, matching it only once.
+
         Values are expected to be either None or start with P or PT
         Have a numerical value in the middle and end with
         a value for the time interval
         It can also start or end with epoch start time denoting a range
         i.e, week beginning or ending with a day
         """
-        pos = {
-            "FIRST": 0,
-            "SECOND": 1,
-            "THIRD": 2,
-            "LAST": 3,
-        }
+        pos = _TIME_GRAIN_SORT_POS
 
         if val[0] is None:
-            return pos["FIRST"]
+            return (pos["FIRST"],) * 4
 
-        prog = re.compile(r"(.*\/)?(P|PT)([0-9\.]+)(S|M|H|D|W|M|Y)(\/.*)?")
-        result = prog.match(val[0])
+        result = _TIME_GRAIN_SORT_RE.match(val[0])
 
         # for any time grains that don't match the format, put them at the end
         if result is None:
-            return pos["LAST"]
+            return (pos["LAST"],) * 4
 
-        second_minute_hour = ["S", "M", "H"]
-        day_week_month_year = ["D", "W", "M", "Y"]
         is_less_than_day = result.group(2) == "PT"
         interval = result.group(4)
         epoch_time_start_string = result.group(1) or result.group(5)
         has_starting_or_ending = bool(len(epoch_time_start_string or ""))
 
-        def sort_day_week() -> int:
-            if has_starting_or_ending:
-                return pos["LAST"]
-            if is_less_than_day:
-                return pos["SECOND"]
-            return pos["THIRD"]
+        if has_starting_or_ending:
+            sort_day_week = pos["LAST"]
+        elif is_less_than_day:
+            sort_day_week = pos["SECOND"]
+        else:
+            sort_day_week = pos["THIRD"]
 
-        def sort_interval() -> float:
-            if is_less_than_day:
-                return second_minute_hour.index(interval)
-            return day_week_month_year.index(interval)
+        if is_less_than_day:
+            sort_interval = _SECOND_MINUTE_HOUR_POS[interval]
+        else:
+            sort_interval = _DAY_WEEK_MONTH_YEAR_POS[interval]
 
         # 0: all "PT" values should come before "P" values (i.e, PT10M)
         # 1: order values within the above arrays ("D" before "W")
         # 2: sort by numeric value (PT10M before PT15M)
         # 3: sort by any week starting/ending values
-        plist = {
-            0: sort_day_week(),
-            1: pos["SECOND"] if is_less_than_day else pos["THIRD"],
-            2: sort_interval(),
-            3: float(result.group(3)),
-        }
-
-        return plist.get(index, 0)
+        return (
+            sort_day_week,
+            pos["SECOND"] if is_less_than_day else pos["THIRD"],
+            sort_interval,
+            float(result.group(3)),
+        )
 
     @classmethod
-    def get_time_grain_expressions(cls) -> dict[str | None, str]:
+    def get_time_grain_expressions(cls) -> Mapping[str | None, str]:
         """
         Return a dict of all supported time grains including any potential added grains
         but excluding any potentially disabled grains in the config file.
 
         :return: All time grain expressions supported by the engine
         """
-        # TODO: use @memoize decorator or similar to avoid recomputation on every call
-        time_grain_expressions = cls._time_grain_expressions.copy()
         grain_addon_expressions = current_app.config["TIME_GRAIN_ADDON_EXPRESSIONS"]
-        time_grain_expressions.update(grain_addon_expressions.get(cls.engine, {}))
         denylist: list[str] = current_app.config["TIME_GRAIN_DENYLIST"]
+
+        # the config is part of the cache key, so changes to it are picked up; the
+        # cached expressions are read-only, so they can be shared by all callers
+        return cls._sorted_time_grain_exprs(
+            tuple(grain_addon_expressions.get(cls.engine, {}).items()),
+            tuple(denylist),
+        )
+
+    @classmethod
+    def get_time_grain_expression(cls, time_grain: str | None) -> str | None:
+        """
+        Return the expression of a single time grain, taking added and disabled
+        grains in the config file into account.
+
+        :param time_grain: time grain, e.g. P1Y for 1 year
+        :return: The time grain expression, or None if the grain isn't supported
+        """
+        if time_grain in current_app.config["TIME_GRAIN_DENYLIST"]:
+            return None
+
+        grain_addon_expressions = current_app.config["TIME_GRAIN_ADDON_EXPRESSIONS"]
+        engine_addon_expressions = grain_addon_expressions.get(cls.engine, {})
+        if time_grain in engine_addon_expressions:
+            return engine_addon_expressions[time_grain]
+        return cls._time_grain_expressions.get(time_grain)
+
+    @classmethod
+    @lru_cache(maxsize=LRU_CACHE_MAX_SIZE)
+    def _sorted_time_grain_exprs(
+        cls,
+        grain_addon_expressions: tuple[tuple[str | None, str], ...],
+        denylist: tuple[str, ...],
+    ) -> Mapping[str | None, str]:
+        """
+        Merge, filter and sort the time grain expressions of the engine.
+
+        :param grain_addon_expressions: Additional expressions for the engine
+        :param denylist: Time grains that should be excluded
+        :return: The sorted time grain expressions
+        """
+        time_grain_expressions = cls._time_grain_expressions.copy()
+        time_grain_expressions.update(grain_addon_expressions)
         for key in denylist:
             time_grain_expressions.pop(key, None)
 
-        return dict(
-            sorted(
-                time_grain_expressions.items(),
-                key=lambda x: (
-                    cls._sort_time_grains(x, 0),
-                    cls._sort_time_grains(x, 1),
-                    cls._sort_time_grains(x, 2),
-                    cls._sort_time_grains(x, 3),
-                ),
-            )
+        return MappingProxyType(
+            dict(sorted(time_grain_expressions.items(), key=cls._sort_time_grains))
         )
 
     @classmethod
@@ -950,32 +1156,75 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
             if cls.limit_method == LimitMethod.FETCH_MANY and limit:
                 return cursor.fetchmany(limit)
             data = cursor.fetchall()
-            description = cursor.description or []
-            # Create a mapping between column name and a mutator function to normalize
-            # values with. The first two items in the description row are
-            # the column name and type.
-            column_mutators = {
-                row[0]: func
-                for row in description
-                if (
-                    func := cls.column_type_mutators.get(
-                        type(cls.get_sqla_column_type(cls.get_datatype(row[1])))
-                    )
-                )
-            }
-            if column_mutators:
-                indexes = {row[0]: idx for idx, row in enumerate(description)}
-                for row_idx, row in enumerate(data):
-                    new_row = list(row)
-                    for col, func in column_mutators.items():
-                        col_idx = indexes[col]
-                        new_row[col_idx] = func(row[col_idx])
-                    data[row_idx] = tuple(new_row)
-
+            if column_mutators := cls._get_column_mutators(cursor.description or []):
+                cls._apply_column_mutators(data, column_mutators)
             return data
         except Exception as ex:
             raise cls.get_dbapi_mapped_exception(ex) from ex
 
+    @classmethod
+    def _get_column_mutators(
+        cls, description: list[tuple[Any, ...]]
+    ) -> tuple[tuple[int, Callable[[Any], Any]], ...]:
+        """
+        Return the column indexes and the mutator function to normalize their
+        values with. The first two items in the description row are the column
+        name and type.
+
+        :param description: Cursor description
+        :return: Column index and mutator pairs
+        """
+        # most engines don't define any mutators, so there's nothing to look up
+        if not cls.column_type_mutators:
+            return ()
+
+        type_codes = tuple(row[1] for row in description)
+        try:
+            return cls._get_cached_column_mutators(type_codes)
+        except TypeError:
+            # some drivers return unhashable type codes, which can't be cached
+            return cls._build_column_mutators(type_codes)
+
+    @classmethod
+    @lru_cache(maxsize=LRU_CACHE_MAX_SIZE)
+    def _get_cached_column_mutators(
+        cls, type_codes: tuple[Any, ...]
+    ) -> tuple[tuple[int, Callable[[Any], Any]], ...]:
+        return cls._build_column_mutators(type_codes)
+
+    @classmethod
+    def _build_column_mutators(
+        cls, type_codes: tuple[Any, ...]
+    ) -> tuple[tuple[int, Callable[[Any], Any]], ...]:
+        return tuple(
+            (idx, func)
+            for idx, type_code in enumerate(type_codes)
+            if (
+                func := cls.column_type_mutators.get(
+                    type(cls.get_sqla_column_type(cls.get_datatype(type_code)))
+                )
+            )
+        )
+
+    @staticmethod
+    def _apply_column_mutators(
+        data: list[tuple[Any, ...]],
+        column_mutators: tuple[tuple[int, Callable[[Any], Any]], ...],
+    ) -> None:
+        """
+        Mutate the rows in place.
+
+        :param data: Rows returned by the cursor
+        :param column_mutators: List of column index and mutator pairs
+        """
+        # mutate the columns one at a time on mutable copies of the rows, and only
+        # convert them back to tuples once at the end
+        rows = [list(row) for row in data]
+        for col_idx, func in column_mutators:
+            for row in rows:
+                row[col_idx] = func(row[col_idx])
+        data[:] = map(tuple, rows)
+
     @classmethod
     def expand_data(
         cls, columns: list[ResultSetColumnType], data: list[dict[Any, Any]]
@@ -1078,12 +1327,6 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         """
         # old method that doesn't work with catalogs
         if hasattr(cls, "extra_table_metadata"):
-            warnings.warn(
-                "The `extra_table_metadata` method is deprecated, please implement "
-                "the `get_extra_table_metadata` method in the DB engine spec.",
-                DeprecationWarning,
-            )
-
             # If a catalog is passed, return nothing, since we don't know the exact
             # table that is being requested.
             if table.catalog:
@@ -1272,6 +1515,7 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         ) as engine:
             if engine.dialect.supports_multivalues_insert:
                 to_sql_kwargs["method"] = "multi"
+            to_sql_kwargs.setdefault("chunksize", cls.df_to_sql_chunksize)
 
             df.to_sql(con=engine, **to_sql_kwargs)
 
@@ -1468,7 +1712,8 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
             raise cls.get_dbapi_mapped_exception(ex) from ex
 
         if schema and cls.try_remove_schema_from_table_name:
-            tables = {re.sub(f"^{schema}\\.", "", table) for table in tables}
+            prefix = f"{schema}."
+            tables = {table.removeprefix(prefix) for table in tables}
         return tables
 
     @classmethod
@@ -1496,7 +1741,8 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
             raise cls.get_dbapi_mapped_exception(ex) from ex
 
         if schema and cls.try_remove_schema_from_table_name:
-            views = {re.sub(f"^{schema}\\.", "", view) for view in views}
+            prefix = f"{schema}."
+            views = {view.removeprefix(prefix) for view in views}
         return views
 
     @classmethod
@@ -1531,8 +1777,7 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         """
         comment = None
         try:
-            comment = inspector.get_table_comment(table.table, table.schema)
-            comment = comment.get("text") if isinstance(comment, dict) else None
+            comment = inspector.get_table_comment(table.table, table.schema).get("text")
         except NotImplementedError:
             # It's expected that some dialects don't implement the comment method
             pass
@@ -1607,15 +1852,15 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         return None
 
     @classmethod
-    def _get_fields(cls, cols: list[ResultSetColumnType]) -> list[Any]:
-        return [
+    def _get_fields(cls, cols: list[ResultSetColumnType]) -> Sequence[Any]:
+        return tuple(
             (
                 literal_column(query_as)
                 if (query_as := c.get("query_as"))
                 else column(c["column_name"])
             )
             for c in cols
-        ]
+        )
 
     @classmethod
     def select_star(  # pylint: disable=too-many-arguments,too-many-locals
@@ -1645,9 +1890,16 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         :return: SQL query
         """
         # pylint: disable=redefined-outer-name
-        fields: str | list[Any] = "*"
+        fields: str | Sequence[Any] = "*"
         cols = cols or []
-        if (show_cols or latest_partition) and not cols:
+        # the base implementation of ``where_latest_partition`` doesn't use the
+        # columns, so only fetch them for engines that filter on partitions
+        filters_partitions = (
+            latest_partition
+            and cls.where_latest_partition.__qualname__
+            != BaseEngineSpec.where_latest_partition.__qualname__
+        )
+        if (show_cols or filters_partitions) and not cols:
             cols = database.get_columns(table)
 
         if show_cols:
@@ -1676,7 +1928,7 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
                 qry = partition_query
         sql = database.compile_sqla_query(qry)
         if indent:
-            sql = SQLScript(sql, engine=cls.engine).format()
+            sql = _format_sql(sql, cls.engine)
         return sql
 
     @classmethod
@@ -1692,6 +1944,24 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
             "Database does not support cost estimation"
         )
 
+    @classmethod
+    def estimate_statements_cost(
+        cls, statements: list[str], cursor: Any
+    ) -> list[dict[str, Any]]:
+        """
+        Estimate the cost of multiple statements.
+
+        By default each statement is estimated separately. Engines that can estimate
+        all the statements in a single request can override this to save round trips.
+
+        :param statements: Processed SQL statements
+        :param cursor: Cursor instance
+        :return: Dictionary with different costs for each statement, in order
+        """
+        return [
+            cls.estimate_statement_cost(statement, cursor) for statement in statements
+        ]
+
     @classmethod
     def query_cost_formatter(
         cls, raw_cost: list[dict[str, Any]]
@@ -1715,8 +1985,8 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         :param database: Database instance
         :return: Dictionary with different costs
         """
-        parsed_query = ParsedQuery(statement, engine=cls.engine)
-        sql = parsed_query.stripped()
+        # equivalent to `ParsedQuery.stripped`, without parsing the whole statement
+        sql = statement.strip(" \t\r\n;")
 
         return database.mutate_sql_based_on_config(sql, is_split=True)
 
@@ -1752,13 +2022,13 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
             source=source,
         ) as conn:
             cursor = conn.cursor()
-            return [
-                cls.estimate_statement_cost(
-                    cls.process_statement(statement, database),
-                    cursor,
-                )
-                for statement in statements
-            ]
+            return cls.estimate_statements_cost(
+                [
+                    cls.process_statement(statement, database)
+                    for statement in statements
+                ],
+                cursor,
+            )
 
     @classmethod
     def get_url_for_impersonation(
@@ -1842,6 +2112,7 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         return g and hasattr(g, "user") and isinstance(ex, cls.oauth2_exception)
 
     @classmethod
+    @lru_cache(maxsize=LRU_CACHE_MAX_SIZE)
     def make_label_compatible(cls, label: str) -> str | quoted_name:
         """
         Conditionally mutate and/or quote a sqlalchemy expression label. If
@@ -1851,6 +2122,9 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         regular string. If maximum supported column name length is exceeded,
         generate a truncated label by calling truncate_label().
 
+        The result only depends on the engine spec and the label, so it's cached, as
+        the same labels are made compatible over and over when building queries.
+
         :param label: expected expression label/alias
         :return: conditionally mutated label supported by the db engine
         """
@@ -1881,9 +2155,19 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         if not column_type:
             return None
 
-        for regex, sqla_type, generic_type in (
-            cls.column_type_mappings + cls._default_column_type_mappings
-        ):
+        if dispatcher := cls._get_compiled_type_dispatcher():
+            pattern, mappings = dispatcher
+            if not (match := pattern.match(column_type)):
+                return None
+            regex, sqla_type, generic_type = mappings[cast(str, match.lastgroup)]
+            if callable(sqla_type):
+                # the groups of the combined pattern are numbered differently, so
+                # callables get the match of their own pattern
+                match = cast(Match[str], regex.match(column_type))
+                return sqla_type(match), generic_type
+            return sqla_type, generic_type
+
+        for regex, sqla_type, generic_type in cls._merged_column_type_mappings:
             match = regex.match(column_type)
             if not match:
                 continue
@@ -1892,6 +2176,44 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
             return sqla_type, generic_type
         return None
 
+    @classmethod
+    @lru_cache(maxsize=LRU_CACHE_MAX_SIZE)
+    def _get_compiled_type_dispatcher(
+        cls,
+    ) -> tuple[Pattern[str], dict[str, ColumnTypeMapping]] | None:
+        """
+        Combine the engine-specific and default column type mappings into a single
+        pattern, with one named group per mapping, so that a column type is resolved
+        with a single match. Alternatives are tried in order, so the first mapping
+        matching the column type still wins.
+
+        :return: The combined pattern and the mapping for each named group, or None if
+            the patterns can't be combined (eg, they use backreferences or global
+            inline flags)
+        """
+        alternatives: list[str] = []
+        mappings: dict[str, ColumnTypeMapping] = {}
+        for idx, mapping in enumerate(cls._merged_column_type_mappings):
+            regex = mapping[0]
+            # group numbers shift in the combined pattern, breaking backreferences
+            if _BACKREFERENCE.search(regex.pattern):
+                return None
+            flags = "".join(
+                char for flag, char in _SCOPED_REGEX_FLAGS if regex.flags & flag
+            )
+            group = f"type_{idx}"
+            alternatives.append(f"(?P<{group}>(?{flags}:{regex.pattern}))")
+            mappings[group] = mapping
+        # an empty alternation would match anything
+        pattern = "|".join(alternatives) or r"(?!)"
+        try:
+            return re.compile(pattern), mappings
+        except re.error:
+            logger.warning(
+                "Unable to combine the column type mappings of %s", cls.__name__
+            )
+            return None
+
     @staticmethod
     def _mutate_label(label: str) -> str:
         """
@@ -1913,14 +2235,14 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         """
         In the case that a label exceeds the max length supported by the engine,
         this method is used to construct a deterministic and unique label based on
-        the original label. By default, this returns a md5 hash of the original label,
-        conditionally truncated if the length of the hash exceeds the max column length
-        of the engine.
+        the original label. By default, this returns a BLAKE2b hash of the original
+        label, conditionally truncated if the length of the hash exceeds the max column
+        length of the engine.
 
         :param label: Expected expression label
         :return: Truncated label
         """
-        label = md5_sha_from_str(label)
+        label = blake2b_from_str(label)
         # truncate hash if it exceeds max length
         if cls.max_column_name_length and len(label) > cls.max_column_name_length:
             label = label[: cls.max_column_name_length]
@@ -1939,11 +2261,15 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         :param dialect: Sqlalchemy dialect
         :return: Compiled column type
         """
-        sqla_column_type = sqla_column_type.copy()
-        if hasattr(sqla_column_type, "collation"):
-            sqla_column_type.collation = None
-        if hasattr(sqla_column_type, "charset"):
-            sqla_column_type.charset = None
+        if (
+            getattr(sqla_column_type, "collation", None) is not None
+            or getattr(sqla_column_type, "charset", None) is not None
+        ):
+            sqla_column_type = sqla_column_type.copy()
+            if hasattr(sqla_column_type, "collation"):
+                sqla_column_type.collation = None
+            if hasattr(sqla_column_type, "charset"):
+                sqla_column_type.charset = None
         return sqla_column_type.compile(dialect=dialect).upper()
 
     @classmethod
@@ -1969,7 +2295,7 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         :return: List of tuples
         """
         if data and type(data[0]).__name__ == "Row":
-            data = [tuple(row) for row in data]
+            data = list(map(tuple, data))
         return data
 
     @staticmethod
@@ -2055,6 +2381,19 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         :param source: Type coming from the database table or cursor description
         :return: ColumnSpec object
         """
+        if not native_type:
+            return None
+        return cls._get_column_spec(native_type)
+
+    @classmethod
+    @lru_cache(maxsize=LRU_CACHE_MAX_SIZE)
+    def _get_column_spec(cls, native_type: str) -> ColumnSpec | None:
+        """
+        Build the column spec of a native type.
+
+        The same native types show up on every column and every introspection, and
+        column specs are immutable, so they are built once per type.
+        """
         if col_types := cls.get_column_types(native_type):
             column_type, generic_type = col_types
             is_dttm = generic_type == GenericDataType.TEMPORAL
@@ -2210,7 +2549,7 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
             db_engine_uri_validator(sqlalchemy_uri)
 
         if existing_disallowed := cls.disallow_uri_query_params.get(
-            sqlalchemy_uri.get_driver_name(), set()
+            sqlalchemy_uri.get_driver_name(), _EMPTY_FROZENSET
         ).intersection(sqlalchemy_uri.query):
             raise ValueError(f"Forbidden query parameter(s): {existing_disallowed}")
 
@@ -2300,14 +2639,14 @@ class BasicParametersMixin:
         parameters: BasicParametersType,
         encrypted_extra: dict[str, str] | None = None,
     ) -> str:
-        # make a copy so that we don't update the original
-        query = parameters.get("query", {}).copy()
+        # ``URL.create`` copies the query, so it only needs a new dict when merging
+        query = parameters.get("query") or {}
         if parameters.get("encryption"):
             if not cls.encryption_parameters:
                 raise Exception(  # pylint: disable=broad-exception-raised
                     "Unable to build a URL with encryption enabled"
                 )
-            query.update(cls.encryption_parameters)
+            query = query | cls.encryption_parameters
 
         return str(
             URL.create(
@@ -2373,59 +2712,74 @@ class BasicParametersMixin:
         host = parameters.get("host", None)
         if not host:
             return errors
-        if not is_hostname_valid(host):
-            errors.append(
-                SupersetError(
-                    message="The hostname provided can't be resolved.",
-                    error_type=SupersetErrorType.CONNECTION_INVALID_HOSTNAME_ERROR,
-                    level=ErrorLevel.ERROR,
-                    extra={"invalid": ["host"]},
-                ),
-            )
-            return errors
 
+        # resolving the host and probing the port are independent blocking network
+        # calls, so start probing the port in the background when it looks valid
         port = parameters.get("port", None)
-        if not port:
-            return errors
+        port_open: Future[bool] | None = None
+        executor = ThreadPoolExecutor(max_workers=1)
+        with contextlib.suppress(ValueError, TypeError):
+            if port and 0 <= int(port) < 2**16:
+                port_open = executor.submit(is_port_open, host, int(port))
+
         try:
-            port = int(port)
-        except (ValueError, TypeError):
-            errors.append(
-                SupersetError(
-                    message="Port must be a valid integer.",
-                    error_type=SupersetErrorType.CONNECTION_INVALID_PORT_ERROR,
-                    level=ErrorLevel.ERROR,
-                    extra={"invalid": ["port"]},
-                ),
-            )
-        if not (isinstance(port, int) and 0 <= port < 2**16):
-            errors.append(
-                SupersetError(
-                    message=(
-                        "The port must be an integer between 0 and 65535 "
-                        "(inclusive)."
+            if not is_hostname_valid(host):
+                errors.append(
+                    SupersetError(
+                        message="The hostname provided can't be resolved.",
+                        error_type=SupersetErrorType.CONNECTION_INVALID_HOSTNAME_ERROR,
+                        level=ErrorLevel.ERROR,
+                        extra={"invalid": ["host"]},
                     ),
-                    error_type=SupersetErrorType.CONNECTION_INVALID_PORT_ERROR,
-                    level=ErrorLevel.ERROR,
-                    extra={"invalid": ["port"]},
-                ),
-            )
-        elif not is_port_open(host, port):
-            errors.append(
-                SupersetError(
-                    message="The port is closed.",
-                    error_type=SupersetErrorType.CONNECTION_PORT_CLOSED_ERROR,
-                    level=ErrorLevel.ERROR,
-                    extra={"invalid": ["port"]},
-                ),
-            )
+                )
+                return errors
+
+            if not port:
+                return errors
+            try:
+                port = int(port)
+            except (ValueError, TypeError):
+                errors.append(
+                    SupersetError(
+                        message="Port must be a valid integer.",
+                        error_type=SupersetErrorType.CONNECTION_INVALID_PORT_ERROR,
+                        level=ErrorLevel.ERROR,
+                        extra={"invalid": ["port"]},
+                    ),
+                )
+            if not (isinstance(port, int) and 0 <= port < 2**16):
+                errors.append(
+                    SupersetError(
+                        message=(
+                            "The port must be an integer between 0 and 65535 "
+                            "(inclusive)."
+                        ),
+                        error_type=SupersetErrorType.CONNECTION_INVALID_PORT_ERROR,
+                        level=ErrorLevel.ERROR,
+                        extra={"invalid": ["port"]},
+                    ),
+                )
+            elif port_open is not None and not port_open.result():
+                errors.append(
+                    SupersetError(
+                        message="The port is closed.",
+                        error_type=SupersetErrorType.CONNECTION_PORT_CLOSED_ERROR,
+                        level=ErrorLevel.ERROR,
+                        extra={"invalid": ["port"]},
+                    ),
+                )
 
-        return errors
+            return errors
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     @classmethod
+    @lru_cache(maxsize=LRU_CACHE_MAX_SIZE)
     def parameters_json_schema(cls) -> Any:
         """
         Return configuration parameters as OpenAPI.
+
+        The schema is fixed for each engine spec, so it's only generated once.
         """
         if not cls.parameters_schema:
             return None
@@ -21,6 +21,7 @@ import contextlib
 import re
 import urllib
 from datetime import datetime
+from functools import lru_cache
 from re import Pattern
 from typing import Any, TYPE_CHECKING, TypedDict
 
@@ -31,6 +32,7 @@ from deprecation import deprecated
 from flask_babel import gettext as __
 from marshmallow import fields, Schema
 from marshmallow.exceptions import ValidationError
+from requests.adapters import HTTPAdapter
 from sqlalchemy import column, types
 from sqlalchemy.engine.base import Engine
 from sqlalchemy.engine.reflection import Inspector
@@ -38,7 +40,7 @@ from sqlalchemy.engine.url import URL
 from sqlalchemy.sql import sqltypes
 
 from superset import sql_parse
-from superset.constants import PASSWORD_MASK, TimeGrain
+from superset.constants import LRU_CACHE_MAX_SIZE, PASSWORD_MASK, TimeGrain
 from superset.databases.schemas import encrypted_field_properties, EncryptedString
 from superset.databases.utils import make_url_safe
 from superset.db_engine_specs.base import BaseEngineSpec, BasicPropertiesType
@@ -48,7 +50,7 @@ from superset.exceptions import SupersetException
 from superset.sql_parse import Table
 from superset.superset_typing import ResultSetColumnType
 from superset.utils import core as utils, json
-from superset.utils.hashing import md5_sha_from_str
+from superset.utils.hashing import blake2b_from_str
 
 try:
     from google.cloud import bigquery
@@ -91,6 +93,12 @@ SYNTAX_ERROR_REGEX = re.compile(
     'Syntax error: Expected end of input but got identifier "(?P<syntax_error>.+?)"'
 )
 
+BYTE_UNITS = ("B", "KB", "MB", "GB")
+
+LABEL_LEADING_DIGIT_REGEX = re.compile(r"^\d")
+
+LABEL_NON_WORD_REGEX = re.compile(r"[^\w]+")
+
 ma_plugin = MarshmallowPlugin()
 
 
@@ -242,7 +250,10 @@ class BigQueryEngineSpec(BaseEngineSpec):  # pylint: disable=too-many-public-met
         # Support type BigQuery Row, introduced here PR #4071
         # google.cloud.bigquery.table.Row
         if data and type(data[0]).__name__ == "Row":
-            data = [r.values() for r in data]  # type: ignore
+            # convert in place, so rows are released as they are converted instead
+            # of keeping two full copies of the result set
+            for i, row in enumerate(data):
+                data[i] = row.values()  # type: ignore
         return data
 
     @staticmethod
@@ -250,35 +261,35 @@ class BigQueryEngineSpec(BaseEngineSpec):  # pylint: disable=too-many-public-met
         """
         BigQuery field_name should start with a letter or underscore and contain only
         alphanumeric characters. Labels that start with a number are prefixed with an
-        underscore. Any unsupported characters are replaced with underscores and an
-        md5 hash is added to the end of the label to avoid possible collisions.
+        underscore. Any unsupported characters are replaced with underscores and a
+        hash is added to the end of the label to avoid possible collisions.
 
         :param label: Expected expression label
         :return: Conditionally mutated label
         """
-        label_hashed = "_" + md5_sha_from_str(label)
+        starts_with_digit = LABEL_LEADING_DIGIT_REGEX.match(label) is not None
+        if not starts_with_digit and not LABEL_NON_WORD_REGEX.search(label):
+            return label
 
         # if label starts with number, add underscore as first character
-        label_mutated = "_" + label if re.match(r"^\d", label) else label
+        label_mutated = "_" + label if starts_with_digit else label
 
         # replace non-alphanumeric characters with underscores
-        label_mutated = re.sub(r"[^\w]+", "_", label_mutated)
-        if label_mutated != label:
-            # add first 5 chars from md5 hash to label to avoid possible collisions
-            label_mutated += label_hashed[:6]
+        label_mutated = LABEL_NON_WORD_REGEX.sub("_", label_mutated)
 
-        return label_mutated
+        # add first 5 chars from the hash to label to avoid possible collisions
+        return label_mutated + "_" + blake2b_from_str(label)[:5]
 
     @classmethod
     def _truncate_label(cls, label: str) -> str:
         """BigQuery requires column names start with either a letter or
         underscore. To make sure this is always the case, an underscore is prefixed
-        to the md5 hash of the original label.
+        to the hash of the original label.
 
         :param label: expected expression label
         :return: truncated label
         """
-        return "_" + md5_sha_from_str(label)
+        return "_" + blake2b_from_str(label)
 
     @classmethod
     @deprecated(deprecated_in="3.0")
@@ -409,16 +420,50 @@ class BigQueryEngineSpec(BaseEngineSpec):  # pylint: disable=too-many-public-met
     def _get_client(cls, engine: Engine) -> bigquery.Client:
         """
         Return the BigQuery client associated with an engine.
+
+        Clients are reused across engines with the same credentials, since building
+        one decodes the service account key and opens a new HTTP session.
         """
         if not dependencies_installed:
             raise SupersetException(
                 "Could not import libraries needed to connect to BigQuery."
             )
 
+        credentials_info = engine.dialect.credentials_info
+        try:
+            credentials_key = tuple(sorted(credentials_info.items()))
+            hash(credentials_key)
+        except (AttributeError, TypeError):
+            return cls._build_client(credentials_info)
+
+        return cls._get_cached_client(credentials_key)
+
+    @classmethod
+    @lru_cache(maxsize=LRU_CACHE_MAX_SIZE)
+    def _get_cached_client(
+        cls,
+        credentials_key: tuple[tuple[str, Any], ...],
+    ) -> bigquery.Client:
+        return cls._build_client(dict(credentials_key))
+
+    @staticmethod
+    def _build_client(credentials_info: dict[str, Any]) -> bigquery.Client:
         credentials = service_account.Credentials.from_service_account_info(
-            engine.dialect.credentials_info
+            credentials_info
         )
-        return bigquery.Client(credentials=credentials)
+        client = bigquery.Client(credentials=credentials)
+
+        # clients are shared across requests, so keep more connections alive than
+        # the default pool of 10 to avoid new TLS handshakes under concurrent use;
+        # mutual TLS sessions mount their own adapter, which must be kept
+        http = client._http  # pylint: disable=protected-access
+        if not http.is_mtls:
+            http.mount(
+                "https://",
+                HTTPAdapter(pool_connections=16, pool_maxsize=64),
+            )
+
+        return client
 
     @classmethod
     def estimate_query_cost(  # pylint: disable=too-many-arguments
@@ -527,25 +572,16 @@ class BigQueryEngineSpec(BaseEngineSpec):  # pylint: disable=too-many-public-met
         # Format Bytes.
         # TODO: Humanize in case more db engine specs need to be added,
         # this should be made a function outside this scope.
-        byte_division = 1024
         if hasattr(query_job, "total_bytes_processed"):
             query_bytes_processed = query_job.total_bytes_processed
-            if query_bytes_processed // byte_division == 0:
-                byte_type = "B"
-                total_bytes_processed = query_bytes_processed
-            elif query_bytes_processed // (byte_division**2) == 0:
-                byte_type = "KB"
-                total_bytes_processed = round(query_bytes_processed / byte_division, 2)
-            elif query_bytes_processed // (byte_division**3) == 0:
-                byte_type = "MB"
-                total_bytes_processed = round(
-                    query_bytes_processed / (byte_division**2), 2
-                )
-            else:
-                byte_type = "GB"
-                total_bytes_processed = round(
-                    query_bytes_processed / (byte_division**3), 2
-                )
+            # number of whole powers of 1024 in the value, picked from its bit length
+            exponent = min(max((query_bytes_processed.bit_length() - 1) // 10, 0), 3)
+            byte_type = BYTE_UNITS[exponent]
+            total_bytes_processed = (
+                round(query_bytes_processed / (1 << (10 * exponent)), 2)
+                if exponent
+                else query_bytes_processed
+            )
 
             return {f"{byte_type} Processed": total_bytes_processed}
         return {}
@@ -650,6 +686,7 @@ class BigQueryEngineSpec(BaseEngineSpec):  # pylint: disable=too-many-public-met
         return []
 
     @classmethod
+    @lru_cache(maxsize=LRU_CACHE_MAX_SIZE)
     def parameters_json_schema(cls) -> Any:
         """
         Return configuration parameters as OpenAPI.
@@ -724,12 +761,13 @@ class BigQueryEngineSpec(BaseEngineSpec):  # pylint: disable=too-many-public-met
                 for col in cols
                 if isinstance(col["type"], sqltypes.ARRAY)
             }
-            cols = [
-                col
-                for col in cols
-                if "." not in col["column_name"]
-                or col["column_name"].split(".")[0] not in array_prefixes
-            ]
+            if array_prefixes:
+                cols = [
+                    col
+                    for col in cols
+                    if "." not in col["column_name"]
+                    or col["column_name"].partition(".")[0] not in array_prefixes
+                ]
 
         return super().select_star(
             database,
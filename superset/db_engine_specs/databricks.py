@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, TYPE_CHECKING, TypedDict, Union
 
 from apispec import APISpec
@@ -27,7 +28,7 @@ from marshmallow.validate import Range
 from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.engine.url import URL
 
-from superset.constants import TimeGrain, USER_AGENT
+from superset.constants import LRU_CACHE_MAX_SIZE, TimeGrain, USER_AGENT
 from superset.databases.utils import make_url_safe
 from superset.db_engine_specs.base import BaseEngineSpec, BasicParametersMixin
 from superset.db_engine_specs.hive import HiveEngineSpec
@@ -413,6 +414,7 @@ class DatabricksNativeEngineSpec(DatabricksDynamicBaseEngineSpec):
         }
 
     @classmethod
+    @lru_cache(maxsize=LRU_CACHE_MAX_SIZE)
     def parameters_json_schema(cls) -> Any:
         """
         Return configuration parameters as OpenAPI.
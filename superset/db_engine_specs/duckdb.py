@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import re
 from datetime import datetime
+from functools import lru_cache
 from re import Pattern
 from typing import Any, TYPE_CHECKING, TypedDict
 
@@ -30,7 +31,7 @@ from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.engine.url import URL
 
 from superset.config import VERSION_STRING
-from superset.constants import TimeGrain, USER_AGENT
+from superset.constants import LRU_CACHE_MAX_SIZE, TimeGrain, USER_AGENT
 from superset.databases.utils import make_url_safe
 from superset.db_engine_specs.base import BaseEngineSpec
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
@@ -172,6 +173,7 @@ class DuckDBParametersMixin:
         return errors
 
     @classmethod
+    @lru_cache(maxsize=LRU_CACHE_MAX_SIZE)
     def parameters_json_schema(cls) -> Any:
         """
         Return configuration parameters as OpenAPI.
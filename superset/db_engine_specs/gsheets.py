@@ -20,6 +20,7 @@ from __future__ import annotations
 import contextlib
 import logging
 import re
+from functools import lru_cache
 from re import Pattern
 from typing import Any, TYPE_CHECKING, TypedDict
 
@@ -37,7 +38,7 @@ from sqlalchemy.engine import create_engine
 from sqlalchemy.engine.url import URL
 
 from superset import db, security_manager
-from superset.constants import PASSWORD_MASK
+from superset.constants import LRU_CACHE_MAX_SIZE, PASSWORD_MASK
 from superset.databases.schemas import encrypted_field_properties, EncryptedString
 from superset.db_engine_specs.shillelagh import ShillelaghEngineSpec
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
@@ -219,6 +220,7 @@ class GSheetsEngineSpec(ShillelaghEngineSpec):
         return json.dumps(new_config)
 
     @classmethod
+    @lru_cache(maxsize=LRU_CACHE_MAX_SIZE)
     def parameters_json_schema(cls) -> Any:
         """
         Return configuration parameters as OpenAPI.
@@ -21,6 +21,7 @@ import os
 import re
 import tempfile
 import time
+from collections.abc import Sequence
 from datetime import datetime
 from typing import Any, TYPE_CHECKING
 from urllib import parse
@@ -456,7 +457,7 @@ class HiveEngineSpec(PrestoEngineSpec):
         return None
 
     @classmethod
-    def _get_fields(cls, cols: list[ResultSetColumnType]) -> list[ColumnClause]:
+    def _get_fields(cls, cols: list[ResultSetColumnType]) -> Sequence[ColumnClause]:
         return BaseEngineSpec._get_fields(cols)  # pylint: disable=protected-access
 
     @classmethod
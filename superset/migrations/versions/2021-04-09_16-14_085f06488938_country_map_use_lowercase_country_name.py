@@ -22,11 +22,13 @@ Create Date: 2021-04-09 16:14:19.040884
 
 """
 
+from typing import Callable
+
 from alembic import op
-from sqlalchemy import Column, Integer, String, Text
+from sqlalchemy import bindparam, Column, Integer, select, String, Text
 from sqlalchemy.ext.declarative import declarative_base
 
-from superset import db
+from superset.migrations.shared.utils import DEFAULT_BATCH_SIZE
 from superset.utils import json
 
 # revision identifiers, used by Alembic.
@@ -44,42 +46,53 @@ class Slice(Base):
     viz_type = Column(String(250))
 
 
-def upgrade():
+def update_country_names(convert: Callable[[str], str]) -> None:
     """
-    Convert all country names to lowercase
+    Convert the country name of all country map charts.
+
+    Only the ids and params are loaded, and the changed charts are written back
+    with batched UPDATE statements instead of one ORM flush per chart.
     """
     bind = op.get_bind()
-    session = db.Session(bind=bind)
+    slices = Slice.__table__
 
-    for slc in session.query(Slice).filter(Slice.viz_type == "country_map").all():
+    updates = []
+    for slice_id, slice_params in bind.execute(
+        select(slices.c.id, slices.c.params).where(slices.c.viz_type == "country_map")
+    ).fetchall():
         try:
-            params = json.loads(slc.params)
+            params = json.loads(slice_params)
             if params.get("select_country"):
-                params["select_country"] = params["select_country"].lower()
-                slc.params = json.dumps(params, sort_keys=True)
+                params["select_country"] = convert(params["select_country"])
+                new_params = json.dumps(params, sort_keys=True)
+                if new_params != slice_params:
+                    updates.append({"slice_id": slice_id, "slice_params": new_params})
         except Exception:
             pass
 
-    session.commit()
-    session.close()
+    statement = (
+        slices.update()
+        .where(slices.c.id == bindparam("slice_id"))
+        .values(params=bindparam("slice_params"))
+    )
+    for start in range(0, len(updates), DEFAULT_BATCH_SIZE):
+        bind.execute(statement, updates[start : start + DEFAULT_BATCH_SIZE])
+
+
+def upgrade():
+    """
+    Convert all country names to lowercase
+    """
+    update_country_names(lambda country: country.lower())
 
 
 def downgrade():
     """
     Convert all country names to sentence case
     """
-    bind = op.get_bind()
-    session = db.Session(bind=bind)
 
-    for slc in session.query(Slice).filter(Slice.viz_type == "country_map").all():
-        try:
-            params = json.loads(slc.params)
-            if params.get("select_country"):
-                country = params["select_country"].lower()
-                params["select_country"] = country[0].upper() + country[1:]
-                slc.params = json.dumps(params, sort_keys=True)
-        except Exception:
-            pass
+    def to_sentence_case(country: str) -> str:
+        country = country.lower()
+        return country[0].upper() + country[1:]
 
-    session.commit()
-    session.close()
+    update_country_names(to_sentence_case)
@@ -0,0 +1,57 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""add covering index to ssh_tunnels
+
+Revision ID: fa38a664d335
+Revises: 02f4f7811799
+Create Date: 2024-06-03 10:12:41.512733
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = "fa38a664d335"
+down_revision = "02f4f7811799"
+
+from alembic import op  # noqa: E402
+
+from superset.migrations.shared.utils import table_has_index  # noqa: E402
+
+table = "ssh_tunnels"
+index = "ix_ssh_tunnels_database_id"
+covering_index = "ix_ssh_tunnels_database_id_covering"
+
+
+def upgrade():
+    # the new index is created before the old one is dropped, since in MySQL the
+    # foreign key on ``database_id`` requires an index at all times
+    if not table_has_index(table, covering_index):
+        op.create_index(
+            covering_index,
+            table,
+            ["database_id"],
+            unique=True,
+            postgresql_include=["server_address", "server_port"],
+        )
+    if table_has_index(table, index):
+        op.drop_index(index, table_name=table)
+
+
+def downgrade():
+    if not table_has_index(table, index):
+        op.create_index(index, table, ["database_id"], unique=True)
+    if table_has_index(table, covering_index):
+        op.drop_index(covering_index, table_name=table)
@@ -160,6 +160,13 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
     is_managed_externally = Column(Boolean, nullable=False, default=False)
     external_url = Column(Text, nullable=True)
 
+    ssh_tunnels: SSHTunnel | None = relationship(
+        "SSHTunnel",
+        back_populates="database",
+        uselist=False,
+        cascade="all, delete-orphan",
+    )
+
     export_fields = [
         "database_name",
         "sqlalchemy_uri",
@@ -418,8 +425,13 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
 
         sqlalchemy_uri = self.sqlalchemy_uri_decrypted
         engine_context = nullcontext()
-        ssh_tunnel = override_ssh_tunnel or DatabaseDAO.get_ssh_tunnel(
-            database_id=self.id
+        ssh_tunnel = override_ssh_tunnel or (
+            # reading the relationship fetches the tunnel at most once per loaded
+            # instance; databases outside of the session (eg, when testing a
+            # connection) still need to look it up
+            self.ssh_tunnels
+            if sqla.inspect(self).persistent
+            else DatabaseDAO.get_ssh_tunnel(database_id=self.id)
         )
 
         if ssh_tunnel:
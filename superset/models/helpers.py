@@ -23,9 +23,9 @@ import logging
 import re
 import uuid
 from collections import defaultdict
-from collections.abc import Hashable
+from collections.abc import Hashable, Sequence
 from datetime import datetime, timedelta
-from typing import Any, cast, NamedTuple, Optional, TYPE_CHECKING, Union
+from typing import Any, Callable, cast, NamedTuple, Optional, TYPE_CHECKING, Union
 
 import dateutil.parser
 import humanize
@@ -111,6 +111,23 @@ VIRTUAL_TABLE_ALIAS = "virtual_table"
 SERIES_LIMIT_SUBQ_ALIAS = "series_limit"
 ADVANCED_DATA_TYPES = config["ADVANCED_DATA_TYPES"]
 
+# SQLA expression builders for filter operators that map directly to a
+# column operation
+NULL_FILTER_OPERATORS: dict[str, Callable[[Any], Any]] = {
+    utils.FilterOperator.IS_NULL.value: lambda col: col.is_(None),
+    utils.FilterOperator.IS_NOT_NULL.value: lambda col: col.isnot(None),
+    utils.FilterOperator.IS_TRUE.value: lambda col: col.is_(True),
+    utils.FilterOperator.IS_FALSE.value: lambda col: col.is_(False),
+}
+COMPARISON_FILTER_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    utils.FilterOperator.EQUALS.value: lambda col, value: col == value,
+    utils.FilterOperator.NOT_EQUALS.value: lambda col, value: col != value,
+    utils.FilterOperator.GREATER_THAN.value: lambda col, value: col > value,
+    utils.FilterOperator.LESS_THAN.value: lambda col, value: col < value,
+    utils.FilterOperator.GREATER_THAN_OR_EQUALS.value: lambda col, value: col >= value,
+    utils.FilterOperator.LESS_THAN_OR_EQUALS.value: lambda col, value: col <= value,
+}
+
 
 def validate_adhoc_subquery(
     sql: str,
@@ -182,11 +199,11 @@ class ImportExportMixin:
     # List of (str) names of attributes
     # with the SQL Alchemy forward references
 
-    export_fields: list[str] = []
+    export_fields: Sequence[str] = []
     # The names of the attributes
     # that are available for import and export
 
-    extra_import_fields: list[str] = []
+    extra_import_fields: Sequence[str] = []
     # Additional fields that should be imported,
     # even though they were not exported
 
@@ -1861,14 +1878,8 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
                     if op == utils.FilterOperator.NOT_IN.value:
                         cond = ~cond
                     where_clause_and.append(cond)
-                elif op == utils.FilterOperator.IS_NULL.value:
-                    where_clause_and.append(sqla_col.is_(None))
-                elif op == utils.FilterOperator.IS_NOT_NULL.value:
-                    where_clause_and.append(sqla_col.isnot(None))
-                elif op == utils.FilterOperator.IS_TRUE.value:
-                    where_clause_and.append(sqla_col.is_(True))
-                elif op == utils.FilterOperator.IS_FALSE.value:
-                    where_clause_and.append(sqla_col.is_(False))
+                elif null_filter := NULL_FILTER_OPERATORS.get(op):
+                    where_clause_and.append(null_filter(sqla_col))
                 else:
                     if (
                         op
@@ -1884,18 +1895,8 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
                                 "with comparison operators"
                             )
                         )
-                    if op == utils.FilterOperator.EQUALS.value:
-                        where_clause_and.append(sqla_col == eq)
-                    elif op == utils.FilterOperator.NOT_EQUALS.value:
-                        where_clause_and.append(sqla_col != eq)
-                    elif op == utils.FilterOperator.GREATER_THAN.value:
-                        where_clause_and.append(sqla_col > eq)
-                    elif op == utils.FilterOperator.LESS_THAN.value:
-                        where_clause_and.append(sqla_col < eq)
-                    elif op == utils.FilterOperator.GREATER_THAN_OR_EQUALS.value:
-                        where_clause_and.append(sqla_col >= eq)
-                    elif op == utils.FilterOperator.LESS_THAN_OR_EQUALS.value:
-                        where_clause_and.append(sqla_col <= eq)
+                    if comparison := COMPARISON_FILTER_OPERATORS.get(op):
+                        where_clause_and.append(comparison(sqla_col, eq))
                     elif op in {
                         utils.FilterOperator.ILIKE.value,
                         utils.FilterOperator.LIKE.value,
@@ -118,6 +118,10 @@ def memoized_func(key: str, cache: Cache = cache_manager.cache) -> Callable[...,
     """
 
     def wrap(f: Callable[..., Any]) -> Callable[..., Any]:
+        # the signature of the decorated function doesn't change, so it's only
+        # inspected once
+        signature = inspect.signature(f)
+
         def wrapped_f(*args: Any, **kwargs: Any) -> Any:
             should_cache = kwargs.pop("cache", True)
             force = kwargs.pop("force", False)
@@ -127,7 +131,6 @@ def memoized_func(key: str, cache: Cache = cache_manager.cache) -> Callable[...,
                 return f(*args, **kwargs)
 
             # format the key using args/kwargs passed to the decorated function
-            signature = inspect.signature(f)
             bound_args = signature.bind(*args, **kwargs)
             bound_args.apply_defaults()
             cache_key = key.format(**bound_args.arguments)
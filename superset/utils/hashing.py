@@ -24,6 +24,15 @@ def md5_sha_from_str(val: str) -> str:
     return hashlib.md5(val.encode("utf-8")).hexdigest()
 
 
+def blake2b_from_str(val: str) -> str:
+    """
+    Hash a string with BLAKE2b, which is faster than MD5 for short strings.
+
+    The digest is truncated to 16 bytes, so the output has the same length as MD5.
+    """
+    return hashlib.blake2b(val.encode("utf-8"), digest_size=16).hexdigest()
+
+
 def md5_sha_from_dict(
     obj: dict[Any, Any],
     ignore_nan: bool = False,
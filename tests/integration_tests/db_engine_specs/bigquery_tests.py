@@ -39,9 +39,9 @@ class TestBigQueryDbEngineSpec(TestDbEngineSpec):
         """
         test_cases = {
             "Col": "Col",
-            "SUM(x)": "SUM_x__5f110",
-            "SUM[x]": "SUM_x__7ebe1",
-            "12345_col": "_12345_col_8d390",
+            "SUM(x)": "SUM_x__53ba3",
+            "SUM[x]": "SUM_x__bf60e",
+            "12345_col": "_12345_col_02340",
         }
         for original, expected in test_cases.items():
             actual = BigQueryEngineSpec.make_label_compatible(column(original).name)
@@ -371,3 +371,31 @@ def test_csv_reader_file_metadata_invalid_file():
         "Parsing error: Error tokenizing data. C error:"
         " Expected 3 fields in line 3, saw 7\n"
     )
+
+
+def test_csv_reader_upload_chunksize(mocker):
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    class ChunkedEngineSpec(BaseEngineSpec):
+        df_to_sql_chunksize = 2
+
+    engine = mocker.MagicMock()
+    engine.dialect.supports_multivalues_insert = True
+    get_engine = mocker.patch.object(ChunkedEngineSpec, "get_engine")
+    get_engine.return_value.__enter__.return_value = engine
+    to_sql = mocker.patch("pandas.DataFrame.to_sql")
+    database = mocker.MagicMock()
+    database.db_engine_spec = ChunkedEngineSpec
+
+    CSVReader().read(create_csv_file(CSV_DATA), database, "my_table", "my_schema")
+
+    # the engine spec decides how many rows are inserted per statement
+    to_sql.assert_called_once_with(
+        con=engine,
+        name="my_table",
+        schema="my_schema",
+        method="multi",
+        chunksize=2,
+        if_exists="fail",
+        index=False,
+    )
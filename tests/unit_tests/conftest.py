@@ -26,8 +26,8 @@ from unittest.mock import patch
 import pytest
 from _pytest.fixtures import SubRequest
 from pytest_mock import MockerFixture
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import ORMExecuteState, raiseload, sessionmaker
 from sqlalchemy.orm.session import Session
 
 from superset import security_manager
@@ -63,6 +63,25 @@ def get_session(mocker: MockerFixture) -> Callable[[], Session]:
         get_session.query = in_memory_session.query
 
         mocker.patch("superset.db.session", in_memory_session)
+
+        # fail loudly on lazy loads from SSH tunnels, since they're fetched in loops
+        @event.listens_for(in_memory_session, "do_orm_execute")
+        def raiseload_ssh_tunnels(orm_execute_state: ORMExecuteState) -> None:
+            from superset.databases.ssh_tunnel.models import SSHTunnel
+
+            if (
+                orm_execute_state.is_select
+                and not orm_execute_state.is_relationship_load
+                and not orm_execute_state.is_column_load
+                and any(
+                    mapper.class_ is SSHTunnel
+                    for mapper in orm_execute_state.all_mappers
+                )
+            ):
+                orm_execute_state.statement = orm_execute_state.statement.options(
+                    raiseload("*")
+                )
+
         return in_memory_session
 
     return get_session
@@ -67,6 +67,42 @@ def test_import_database(mocker: MockerFixture, session: Session) -> None:
     assert database.allow_dml is False
 
 
+def test_import_database_ssh_tunnel(mocker: MockerFixture, session: Session) -> None:
+    """
+    Test that connecting after an import uses the imported SSH tunnel.
+    """
+    from superset import security_manager
+    from superset.commands.database.importers.v1.utils import import_database
+    from superset.models.core import Database
+    from tests.integration_tests.fixtures.importexport import (
+        database_config,
+        database_with_ssh_tunnel_config_password,
+    )
+
+    mocker.patch.object(security_manager, "can_access", return_value=True)
+
+    engine = db.session.get_bind()
+    Database.metadata.create_all(engine)  # pylint: disable=no-member
+
+    database = import_database(copy.deepcopy(database_config))
+    assert database.ssh_tunnels is None
+
+    config = copy.deepcopy(database_with_ssh_tunnel_config_password)
+    database = import_database(config, overwrite=True)
+    assert database.ssh_tunnels is not None
+    assert database.ssh_tunnels.server_address == "localhost"
+
+    ssh_manager_factory = mocker.patch("superset.models.core.ssh_manager_factory")
+    mocker.patch.object(database, "_get_sqla_engine")
+    with database.get_sqla_engine():
+        pass
+
+    ssh_manager_factory.instance.create_tunnel.assert_called_once_with(
+        ssh_tunnel=database.ssh_tunnels,
+        sqlalchemy_database_uri=database.sqlalchemy_uri_decrypted,
+    )
+
+
 def test_import_database_sqlite_invalid(
     mocker: MockerFixture, session: Session
 ) -> None:
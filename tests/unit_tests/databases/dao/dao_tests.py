@@ -16,8 +16,10 @@
 # under the License.
 
 from collections.abc import Iterator
+from typing import Any
 
 import pytest
+from sqlalchemy import event
 from sqlalchemy.orm.session import Session
 
 
@@ -67,3 +69,26 @@ def test_database_get_ssh_tunnel_not_found(session_with_data: Session) -> None:
     result = DatabaseDAO.get_ssh_tunnel(2)
 
     assert result is None
+
+
+def test_database_ssh_tunnels_lazy_loaded(session_with_data: Session) -> None:
+    from superset.databases.ssh_tunnel.models import SSHTunnel
+    from superset.models.core import Database
+
+    statements = []
+    engine = session_with_data.get_bind()
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def count_statements(*args: Any) -> None:
+        statements.append(args[2])
+
+    session_with_data.expire_all()
+    database = session_with_data.query(Database).one()
+    assert len(statements) == 1
+    assert "ssh_tunnels" not in database.__dict__
+
+    assert isinstance(database.ssh_tunnels, SSHTunnel)
+    assert isinstance(database.ssh_tunnels, SSHTunnel)
+    assert len(statements) == 2
+
+    event.remove(engine, "before_cursor_execute", count_statements)
@@ -0,0 +1,161 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from typing import Any
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.orm.session import Session
+from sqlalchemy.types import Text
+
+
+def test_ssh_tunnel_data_masks_secrets() -> None:
+    from superset.constants import PASSWORD_MASK
+    from superset.databases.ssh_tunnel.models import SSHTunnel
+
+    ssh_tunnel = SSHTunnel(
+        id=1,
+        server_address="123.132.123.1",
+        server_port=8080,
+        username="foo",
+        password="bar",
+    )
+
+    assert ssh_tunnel.data == {
+        "id": 1,
+        "server_address": "123.132.123.1",
+        "server_port": 8080,
+        "username": "foo",
+        "password": PASSWORD_MASK,
+    }
+
+
+def test_ssh_tunnel_data_expired(session: Session) -> None:
+    from superset.constants import PASSWORD_MASK
+    from superset.databases.ssh_tunnel.models import SSHTunnel
+    from superset.models.core import Database
+
+    SSHTunnel.metadata.create_all(session.get_bind())  # pylint: disable=no-member
+    database = Database(database_name="my_database", sqlalchemy_uri="sqlite://")
+    ssh_tunnel = SSHTunnel(
+        database=database,
+        server_address="123.132.123.1",
+        server_port=8080,
+        username="foo",
+        private_key="private_key",
+        private_key_password="private_key_password",
+    )
+    session.add(ssh_tunnel)
+    session.flush()
+    session.expire(ssh_tunnel)
+
+    assert ssh_tunnel.data == {
+        "id": ssh_tunnel.id,
+        "server_address": "123.132.123.1",
+        "server_port": 8080,
+        "username": "foo",
+        "private_key": PASSWORD_MASK,
+        "private_key_password": PASSWORD_MASK,
+    }
+
+
+def test_ssh_tunnel_data_single_query(session: Session) -> None:
+    from superset.constants import PASSWORD_MASK
+    from superset.databases.ssh_tunnel.models import SSHTunnel
+    from superset.models.core import Database
+
+    engine = session.get_bind()
+    SSHTunnel.metadata.create_all(engine)  # pylint: disable=no-member
+    database = Database(database_name="my_database", sqlalchemy_uri="sqlite://")
+    session.add(SSHTunnel(database=database, username="foo", password="bar"))
+    session.flush()
+    session.expire_all()
+
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def count_statements(*args: Any) -> None:
+        statements.append(args[2])
+
+    ssh_tunnel = session.query(SSHTunnel).one()
+    assert ssh_tunnel.data["password"] == PASSWORD_MASK
+    assert len(statements) == 1
+
+    event.remove(engine, "before_cursor_execute", count_statements)
+
+
+def test_memoized_encrypted_type_cache_hit() -> None:
+    from superset.databases.ssh_tunnel.models import MemoizedEncryptedType
+
+    dialect = sqlite.dialect()
+    encrypted_type = MemoizedEncryptedType(Text, "secret_key")
+    ciphertext = encrypted_type.process_bind_param("password", dialect)
+
+    assert encrypted_type.process_result_value(ciphertext, dialect) == "password"
+    assert encrypted_type.process_result_value(ciphertext, dialect) == "password"
+    assert encrypted_type.process_result_value(None, dialect) is None
+    assert encrypted_type.cache.cache_info().hits == 1
+    assert encrypted_type.cache.cache_info().misses == 1
+
+
+def test_memoized_encrypted_type_key_rotation() -> None:
+    from superset.databases.ssh_tunnel.models import MemoizedEncryptedType
+
+    dialect = sqlite.dialect()
+    keys = ["previous_secret_key"]
+    encrypted_type = MemoizedEncryptedType(Text, lambda: keys[-1])
+    ciphertext = encrypted_type.process_bind_param("password", dialect)
+    assert encrypted_type.process_result_value(ciphertext, dialect) == "password"
+
+    # values decrypted with the previous key are not served once it changes
+    keys.append("secret_key")
+    with pytest.raises(ValueError):
+        encrypted_type.process_result_value(ciphertext, dialect)
+
+    ciphertext = encrypted_type.process_bind_param("password", dialect)
+    assert encrypted_type.process_result_value(ciphertext, dialect) == "password"
+
+
+def test_ssh_tunnel_decryption_cache_cleared(session: Session) -> None:
+    from superset.databases.ssh_tunnel.models import _ENCRYPTED_TEXT, SSHTunnel
+    from superset.models.core import Database
+
+    SSHTunnel.metadata.create_all(session.get_bind())  # pylint: disable=no-member
+    database = Database(database_name="my_database", sqlalchemy_uri="sqlite://")
+    ssh_tunnel = SSHTunnel(database=database, username="foo", password="bar")
+    session.add(ssh_tunnel)
+    session.flush()
+
+    def load_credentials() -> None:
+        session.expire(ssh_tunnel)
+        assert ssh_tunnel.username == "foo"
+        assert ssh_tunnel.password == "bar"
+
+    load_credentials()
+    assert _ENCRYPTED_TEXT.cache.cache_info().currsize > 0
+
+    ssh_tunnel.server_port = 22
+    session.flush()
+    assert _ENCRYPTED_TEXT.cache.cache_info().currsize == 0
+
+    load_credentials()
+    assert _ENCRYPTED_TEXT.cache.cache_info().currsize > 0
+
+    session.delete(ssh_tunnel)
+    session.flush()
+    assert _ENCRYPTED_TEXT.cache.cache_info().currsize == 0
@@ -18,7 +18,7 @@
 # pylint: disable=line-too-long, import-outside-toplevel, protected-access, invalid-name
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
 import pytest
 from pytest_mock import MockerFixture
@@ -427,3 +427,141 @@ def test_adjust_engine_params_no_catalog() -> None:
         catalog="other-project",
     )[0]
     assert str(uri) == "bigquery://other-project/"
+
+
+def test_get_client_cached(mocker: MockerFixture) -> None:
+    """
+    Test that clients are reused for the same credentials.
+    """
+    from superset.db_engine_specs.bigquery import BigQueryEngineSpec
+
+    mocker.patch("superset.db_engine_specs.bigquery.dependencies_installed", True)
+    service_account = mocker.patch("superset.db_engine_specs.bigquery.service_account")
+    bigquery = mocker.patch("superset.db_engine_specs.bigquery.bigquery")
+    bigquery.Client.side_effect = lambda credentials: mocker.MagicMock()
+
+    engine = mocker.MagicMock()
+    engine.dialect.credentials_info = {"client_email": "test-cached@example.com"}
+    other_engine = mocker.MagicMock()
+    other_engine.dialect.credentials_info = {"client_email": "test-cached@example.com"}
+
+    client = BigQueryEngineSpec._get_client(engine)
+    assert BigQueryEngineSpec._get_client(other_engine) is client
+    service_account.Credentials.from_service_account_info.assert_called_once_with(
+        {"client_email": "test-cached@example.com"}
+    )
+
+    other_engine.dialect.credentials_info = {"client_email": "other@example.com"}
+    assert BigQueryEngineSpec._get_client(other_engine) is not client
+
+
+@pytest.mark.parametrize(
+    "original,expected",
+    [
+        ("Col", "Col"),
+        ("SUM(x)", "SUM_x__53ba3"),
+        ("SUM[x]", "SUM_x__bf60e"),
+        ("12345_col", "_12345_col_02340"),
+    ],
+)
+def test_mutate_label(mocker: MockerFixture, original: str, expected: str) -> None:
+    """
+    Test that only labels that need mutating are hashed.
+    """
+    from superset.db_engine_specs.bigquery import BigQueryEngineSpec
+    from superset.utils.hashing import blake2b_from_str as original_blake2b_from_str
+
+    blake2b_from_str = mocker.patch(
+        "superset.db_engine_specs.bigquery.blake2b_from_str",
+        wraps=original_blake2b_from_str,
+    )
+
+    assert BigQueryEngineSpec._mutate_label(original) == expected
+    assert blake2b_from_str.called == (original != expected)
+
+
+@pytest.mark.parametrize(
+    "total_bytes_processed,expected",
+    [
+        (0, {"B Processed": 0}),
+        (1023, {"B Processed": 1023}),
+        (1024, {"KB Processed": 1.0}),
+        (1536, {"KB Processed": 1.5}),
+        (1024**2 - 1, {"KB Processed": 1024.0}),
+        (1024**2, {"MB Processed": 1.0}),
+        (1024**3, {"GB Processed": 1.0}),
+        (5 * 1024**4, {"GB Processed": 5120.0}),
+    ],
+)
+def test_custom_estimate_statement_cost(
+    mocker: MockerFixture,
+    total_bytes_processed: int,
+    expected: dict[str, float],
+) -> None:
+    """
+    Test that the processed bytes are formatted with the right unit.
+    """
+    from superset.db_engine_specs.bigquery import BigQueryEngineSpec
+
+    client = mocker.MagicMock()
+    client.query().total_bytes_processed = total_bytes_processed
+
+    assert (
+        BigQueryEngineSpec.custom_estimate_statement_cost("SELECT 1", client)
+        == expected
+    )
+
+
+def test_fetch_data_rows(mocker: MockerFixture) -> None:
+    """
+    Test that BigQuery rows are converted to values in place.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.db_engine_specs.bigquery import BigQueryEngineSpec
+
+    class Row:
+        def __init__(self, *values: Any) -> None:
+            self._values = values
+
+        def values(self) -> tuple[Any, ...]:
+            return self._values
+
+    data = [Row(1, "foo"), Row(2, "bar")]
+    mocker.patch.object(BaseEngineSpec, "fetch_data", return_value=data)
+
+    result = BigQueryEngineSpec.fetch_data(mocker.MagicMock())
+    assert result is data
+    assert result == [(1, "foo"), (2, "bar")]
+
+
+@pytest.mark.parametrize("is_mtls", [False, True])
+def test_build_client_connection_pool(mocker: MockerFixture, is_mtls: bool) -> None:
+    """
+    Test that shared clients get a larger connection pool, unless using mutual TLS.
+    """
+    from superset.db_engine_specs.bigquery import BigQueryEngineSpec
+
+    mocker.patch("superset.db_engine_specs.bigquery.service_account")
+    bigquery = mocker.patch("superset.db_engine_specs.bigquery.bigquery")
+    session = bigquery.Client()._http
+    session.is_mtls = is_mtls
+
+    BigQueryEngineSpec._build_client({"client_email": "test@example.com"})
+
+    if is_mtls:
+        session.mount.assert_not_called()
+    else:
+        session.mount.assert_called_once()
+        prefix, adapter = session.mount.call_args.args
+        assert prefix == "https://"
+        assert adapter._pool_maxsize == 64
+
+
+def test_truncate_label() -> None:
+    """
+    Test that truncated labels are a hash prefixed with an underscore.
+    """
+    from superset.db_engine_specs.bigquery import BigQueryEngineSpec
+
+    label = BigQueryEngineSpec._truncate_label("SUM(x)")
+    assert label == "_53ba3464ba8c085c82e7241175431ff9"
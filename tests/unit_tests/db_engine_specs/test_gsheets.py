@@ -540,14 +540,16 @@ def test_get_oauth2_token(
     """
     from superset.db_engine_specs.gsheets import GSheetsEngineSpec
 
-    requests = mocker.patch("superset.db_engine_specs.base.requests")
-    requests.post().json.return_value = {
-        "access_token": "access-token",
-        "expires_in": 3600,
-        "scope": "scope",
-        "token_type": "Bearer",
-        "refresh_token": "refresh-token",
-    }
+    session = mocker.patch("superset.db_engine_specs.base._OAUTH2_SESSION")
+    session.post().content = json.dumps(
+        {
+            "access_token": "access-token",
+            "expires_in": 3600,
+            "scope": "scope",
+            "token_type": "Bearer",
+            "refresh_token": "refresh-token",
+        }
+    ).encode()
 
     assert GSheetsEngineSpec.get_oauth2_token(oauth2_config, "code") == {
         "access_token": "access-token",
@@ -556,7 +558,7 @@ def test_get_oauth2_token(
         "token_type": "Bearer",
         "refresh_token": "refresh-token",
     }
-    requests.post.assert_called_with(
+    session.post.assert_called_with(
         "https://oauth2.googleapis.com/token",
         json={
             "code": "code",
@@ -578,14 +580,16 @@ def test_get_oauth2_fresh_token(
     """
     from superset.db_engine_specs.gsheets import GSheetsEngineSpec
 
-    requests = mocker.patch("superset.db_engine_specs.base.requests")
-    requests.post().json.return_value = {
-        "access_token": "access-token",
-        "expires_in": 3600,
-        "scope": "scope",
-        "token_type": "Bearer",
-        "refresh_token": "refresh-token",
-    }
+    session = mocker.patch("superset.db_engine_specs.base._OAUTH2_SESSION")
+    session.post().content = json.dumps(
+        {
+            "access_token": "access-token",
+            "expires_in": 3600,
+            "scope": "scope",
+            "token_type": "Bearer",
+            "refresh_token": "refresh-token",
+        }
+    ).encode()
 
     assert GSheetsEngineSpec.get_oauth2_fresh_token(oauth2_config, "refresh-token") == {
         "access_token": "access-token",
@@ -594,7 +598,7 @@ def test_get_oauth2_fresh_token(
         "token_type": "Bearer",
         "refresh_token": "refresh-token",
     }
-    requests.post.assert_called_with(
+    session.post.assert_called_with(
         "https://oauth2.googleapis.com/token",
         json={
             "client_id": "XXX.apps.googleusercontent.com",
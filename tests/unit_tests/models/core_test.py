@@ -23,6 +23,7 @@ import pytest
 from pytest_mock import MockerFixture
 from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.engine.url import make_url
+from sqlalchemy.orm.session import Session
 
 from superset.connectors.sqla.models import SqlaTable, TableColumn
 from superset.exceptions import OAuth2Error, OAuth2RedirectError
@@ -393,6 +394,34 @@ def test_get_sqla_engine_user_impersonation_email(mocker: MockerFixture) -> None
     )
 
 
+def test_get_sqla_engine_ssh_tunnel(mocker: MockerFixture, session: Session) -> None:
+    """
+    Test that `get_sqla_engine` reuses the SSH tunnel loaded with the database.
+    """
+    from superset.databases.ssh_tunnel.models import SSHTunnel
+
+    Database.metadata.create_all(session.get_bind())  # pylint: disable=no-member
+    database = Database(database_name="my_db", sqlalchemy_uri="sqlite://")
+    session.add(SSHTunnel(database=database, server_address="example.org"))
+    session.flush()
+    session.expire_all()
+
+    ssh_manager_factory = mocker.patch("superset.models.core.ssh_manager_factory")
+    ssh_manager_factory.instance.build_sqla_url.return_value = "sqlite://"
+    get_ssh_tunnel = mocker.patch("superset.daos.database.DatabaseDAO.get_ssh_tunnel")
+    mocker.patch.object(database, "_get_sqla_engine")
+
+    for _ in range(2):
+        with database.get_sqla_engine():
+            pass
+
+    get_ssh_tunnel.assert_not_called()
+    ssh_manager_factory.instance.create_tunnel.assert_called_with(
+        ssh_tunnel=database.ssh_tunnels,
+        sqlalchemy_database_uri="sqlite://",
+    )
+
+
 def test_is_oauth2_enabled() -> None:
     """
     Test the `is_oauth2_enabled` method.
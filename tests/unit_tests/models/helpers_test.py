@@ -155,3 +155,56 @@ def test_values_for_column_double_percents(
             ),
             con=engine,
         )
+
+
+@pytest.mark.parametrize(
+    "op,val,expected",
+    [
+        ("==", 1, "a = 1"),
+        ("!=", 1, "a <> 1"),
+        (">", 1, "a > 1"),
+        ("<", 1, "a < 1"),
+        (">=", 1, "a >= 1"),
+        ("<=", 1, "a <= 1"),
+        ("IS NULL", None, "a IS NULL"),
+        ("IS NOT NULL", None, "NOT a IS NULL"),
+        ("IS TRUE", None, "a IS 1"),
+        ("IS FALSE", None, "a IS 0"),
+    ],
+)
+def test_get_sqla_query_filter_operators(
+    mocker: MockerFixture,
+    database: Database,
+    op: str,
+    val: int | None,
+    expected: str,
+) -> None:
+    """
+    Test that comparison and null filters are rendered in the WHERE clause.
+    """
+    from superset.connectors.sqla.models import SqlaTable, TableColumn
+
+    with database.get_sqla_engine() as engine:
+        mocker.patch.object(
+            database,
+            "get_sqla_engine",
+            new=contextmanager(lambda **kwargs: (yield engine)),
+        )
+
+    table = SqlaTable(
+        database=database,
+        schema=None,
+        table_name="t",
+        columns=[TableColumn(column_name="a"), TableColumn(column_name="b")],
+    )
+
+    sql = table.get_query_str(
+        {
+            "columns": ["b"],
+            "filter": [{"col": "a", "op": op, "val": val}],
+            "is_timeseries": False,
+            "metrics": [],
+            "row_limit": 10,
+        }
+    )
+    assert f"WHERE {expected} GROUP BY" in " ".join(sql.split())